@@ -0,0 +1,104 @@
+-- user-026: Build the recommendation candidate index from admissions_data
+-- Lets /api/institutions/candidates read the institutions near a user in their SAT
+-- range instead of categorizing every institution.
+--
+-- * Score ranges come from the latest admissions_data year per institution: SAT
+--   math + verbal totals, falling back to the convertActToSat concordance
+--   (half-up rounding, act * 40 outside the table).
+-- * Each institution is written once for every 100-point band its 25th-75th range
+--   overlaps. Institutions without SAT/ACT ranges go in band -1, which every
+--   request reads.
+-- * rank orders each (sat_band, state) group by acceptance rate, most selective
+--   first, unknown rates last.
+-- * average_sat / average_act are derived the same way as scripts/calculate-roi.js
+--   so categorizeInstitution sees the same values as on the institutions table.
+--
+-- Safe to re-run: the table is rebuilt from scratch. Re-apply after each data
+-- refresh: turso db shell <college-db> < scripts/migrations/add_recommendation_candidates.sql
+-- scripts/refresh_database.py runs this file after loading admissions data.
+-- Band width and sentinel must match SAT_BAND_WIDTH / UNSCORED_SAT_BAND in
+-- src/lib/recommendations.ts.
+
+DROP TABLE IF EXISTS recommendation_candidates;
+
+CREATE TABLE recommendation_candidates (
+  id INTEGER PRIMARY KEY,
+  sat_band INTEGER NOT NULL,
+  state TEXT,
+  rank INTEGER NOT NULL,
+  unitid INTEGER NOT NULL,
+  acceptance_rate REAL,
+  sat_25th REAL,
+  sat_75th REAL,
+  average_sat INTEGER,
+  average_act INTEGER,
+  latitude REAL,
+  longitude REAL,
+  FOREIGN KEY (unitid) REFERENCES institutions (unitid)
+);
+
+WITH RECURSIVE
+act_concordance (act, sat) AS (
+  VALUES
+    (36, 1590), (35, 1540), (34, 1500), (33, 1460), (32, 1430),
+    (31, 1400), (30, 1370), (29, 1340), (28, 1310), (27, 1280),
+    (26, 1240), (25, 1210), (24, 1180), (23, 1140), (22, 1110),
+    (21, 1080), (20, 1040), (19, 1010), (18, 970), (17, 930),
+    (16, 890), (15, 850), (14, 800), (13, 760), (12, 710),
+    (11, 670), (10, 630), (9, 590)
+),
+latest_admissions AS (
+  SELECT a.*,
+         ROW_NUMBER() OVER (PARTITION BY a.unitid ORDER BY a.year DESC, a.id DESC) AS rn
+  FROM admissions_data a
+),
+scores AS (
+  SELECT
+    i.unitid, i.state, i.latitude, i.longitude,
+    CAST(a.admissions_total AS REAL) / NULLIF(a.applicants_total, 0) AS acceptance_rate,
+    COALESCE(a.sat_math_25th + a.sat_verbal_25th, c25.sat, a.act_composite_25th * 40) AS sat_25th,
+    COALESCE(a.sat_math_75th + a.sat_verbal_75th, c75.sat, a.act_composite_75th * 40) AS sat_75th,
+    CASE WHEN a.sat_math_25th AND a.sat_verbal_25th THEN ROUND(
+      (a.sat_math_25th + COALESCE(NULLIF(a.sat_math_75th, 0), a.sat_math_25th)) / 2.0 +
+      (a.sat_verbal_25th + COALESCE(NULLIF(a.sat_verbal_75th, 0), a.sat_verbal_25th)) / 2.0
+    ) END AS average_sat,
+    CASE WHEN a.act_composite_25th THEN ROUND(
+      (a.act_composite_25th + COALESCE(NULLIF(a.act_composite_75th, 0), a.act_composite_25th)) / 2.0
+    ) END AS average_act
+  FROM institutions i
+  LEFT JOIN latest_admissions a ON a.unitid = i.unitid AND a.rn = 1
+  LEFT JOIN act_concordance c25 ON c25.act = CAST(ROUND(a.act_composite_25th) AS INTEGER)
+  LEFT JOIN act_concordance c75 ON c75.act = CAST(ROUND(a.act_composite_75th) AS INTEGER)
+  WHERE i.unitid IS NOT NULL AND i.latitude IS NOT NULL AND i.longitude IS NOT NULL
+),
+bands (unitid, sat_band, high_band) AS (
+  SELECT unitid,
+         CASE WHEN sat_25th IS NULL OR sat_75th IS NULL THEN -1
+              ELSE CAST(sat_25th / 100 AS INTEGER) * 100 END,
+         CASE WHEN sat_25th IS NULL OR sat_75th IS NULL THEN -1
+              ELSE CAST(sat_75th / 100 AS INTEGER) * 100 END
+  FROM scores
+  UNION ALL
+  SELECT unitid, sat_band + 100, high_band
+  FROM bands
+  WHERE sat_band + 100 <= high_band
+)
+INSERT INTO recommendation_candidates (
+  sat_band, state, rank, unitid, acceptance_rate, sat_25th, sat_75th,
+  average_sat, average_act, latitude, longitude
+)
+SELECT
+  b.sat_band, s.state,
+  ROW_NUMBER() OVER (
+    PARTITION BY b.sat_band, s.state
+    ORDER BY s.acceptance_rate IS NULL, s.acceptance_rate, s.unitid
+  ) - 1,
+  s.unitid, s.acceptance_rate, s.sat_25th, s.sat_75th,
+  s.average_sat, s.average_act, s.latitude, s.longitude
+FROM bands b
+JOIN scores s ON s.unitid = b.unitid
+ORDER BY b.sat_band, s.state, s.acceptance_rate IS NULL, s.acceptance_rate, s.unitid;
+
+CREATE INDEX IF NOT EXISTS idx_candidates_band_state ON recommendation_candidates(sat_band, state, rank);
+
+CREATE INDEX IF NOT EXISTS idx_candidates_location ON recommendation_candidates(latitude, longitude);
@@ -16,6 +16,9 @@ import logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Builds recommendation_candidates, shared with the deployed database migration
+RECOMMENDATION_INDEX_SQL = Path(__file__).resolve().parent / "migrations" / "add_recommendation_candidates.sql"
+
 class DatabaseRefresher:
     def __init__(self, db_path="../college-scrapper/data/college_data.db"):
         self.db_path = Path(db_path).resolve()
@@ -39,7 +42,7 @@ class DatabaseRefresher:
         
         # Drop existing tables
         tables_to_drop = [
-            'earnings_outcomes', 'financial_data', 'admissions_data', 
+            'recommendation_candidates', 'earnings_outcomes', 'financial_data', 'admissions_data', 
             'academic_programs', 'institutions', 'cip_codes_ref'
         ]
         
@@ -480,6 +483,107 @@ class DatabaseRefresher:
             roi_count = len(df_mapped)
             logger.info(f"   ✅ Loaded {roi_count:,} ROI/earnings records")
         
+    def load_admissions_data(self):
+        """Load admissions and test score data"""
+        
+        logger.info("🎓 Loading admissions data...")
+        
+        # Try to load the most recent IPEDS admissions file
+        admissions_files = [
+            self.data_dir / "adm2023.csv",
+            self.data_dir / "adm2022.csv"
+        ]
+        
+        admissions_file = None
+        for file in admissions_files:
+            if file.exists():
+                admissions_file = file
+                break
+                
+        if not admissions_file:
+            logger.warning("❌ No admissions file found")
+            return
+            
+        logger.info(f"📂 Loading from: {admissions_file.name}")
+        df = pd.read_csv(admissions_file, low_memory=False, encoding='utf-8-sig')
+        
+        # Extract year from filename
+        year = 2023 if "2023" in admissions_file.name else 2022
+        
+        # Map columns based on IPEDS ADM structure
+        column_mapping = {
+            'UNITID': 'unitid',
+            'APPLCN': 'applicants_total',
+            'APPLCNM': 'applicants_men',
+            'APPLCNW': 'applicants_women',
+            'ADMSSN': 'admissions_total',
+            'ADMSSNM': 'admissions_men',
+            'ADMSSNW': 'admissions_women',
+            'ENRLT': 'enrolled_total',
+            'ENRLM': 'enrolled_men',
+            'ENRLW': 'enrolled_women',
+            'ENRLFT': 'enrolled_full_time',
+            'ENRLPT': 'enrolled_part_time',
+            'SATMT25': 'sat_math_25th',
+            'SATMT75': 'sat_math_75th',
+            'SATVR25': 'sat_verbal_25th',
+            'SATVR75': 'sat_verbal_75th',
+            'ACTCM25': 'act_composite_25th',
+            'ACTCM75': 'act_composite_75th'
+        }
+        
+        # Select and rename columns that exist
+        available_columns = {}
+        for ipeds_col, db_col in column_mapping.items():
+            if ipeds_col in df.columns:
+                available_columns[ipeds_col] = db_col
+                
+        df_mapped = df[list(available_columns.keys())].rename(columns=available_columns)
+        df_mapped['year'] = year
+        
+        # Convert to numeric (IPEDS uses "." for suppressed values)
+        numeric_cols = [col for col in df_mapped.columns if col not in ['year']]
+        for col in numeric_cols:
+            df_mapped[col] = pd.to_numeric(df_mapped[col], errors='coerce')
+        
+        # Only keep records where unitid exists in institutions table
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT unitid FROM institutions")
+        valid_unitids = set(row[0] for row in cursor.fetchall())
+        
+        df_mapped = df_mapped[df_mapped['unitid'].isin(valid_unitids)]
+        df_mapped = df_mapped.dropna(subset=['unitid'])
+        
+        # Insert data
+        df_mapped.to_sql('admissions_data', self.conn, if_exists='append', index=False)
+        
+        admissions_count = len(df_mapped)
+        logger.info(f"   ✅ Loaded {admissions_count:,} admissions records")
+        
+    def build_recommendation_index(self):
+        """Build the recommendation candidate index
+        
+        Runs scripts/migrations/add_recommendation_candidates.sql, the same
+        migration used on the deployed database, so both stay identical.
+        """
+        
+        logger.info("🎯 Building recommendation candidate index...")
+        
+        self.conn.executescript(RECOMMENDATION_INDEX_SQL.read_text())
+        
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT COUNT(DISTINCT unitid),
+                   COUNT(DISTINCT CASE WHEN sat_band < 0 THEN unitid END),
+                   COUNT(*)
+            FROM recommendation_candidates
+        """)
+        institution_count, unscored_count, entry_count = cursor.fetchone()
+        logger.info(
+            f"   ✅ Indexed {institution_count:,} institutions "
+            f"({unscored_count:,} without test scores, {entry_count:,} band entries)"
+        )
+        
     def refresh_database(self):
         """Complete database refresh process"""
         
@@ -497,6 +601,10 @@ class DatabaseRefresher:
         self.load_financial_data() 
         self.load_programs_data()
         self.load_roi_analysis_data()
+        self.load_admissions_data()
+        
+        # Derived lookup tables
+        self.build_recommendation_index()
         
         # Final commit and close
         self.conn.commit()
@@ -504,7 +612,8 @@ class DatabaseRefresher:
         # Get final counts
         cursor = self.conn.cursor()
         
-        tables = ['institutions', 'financial_data', 'academic_programs', 'earnings_outcomes']
+        tables = ['institutions', 'financial_data', 'academic_programs', 'earnings_outcomes',
+                  'admissions_data', 'recommendation_candidates']
         logger.info("\n📊 Final database statistics:")
         
         for table in tables:
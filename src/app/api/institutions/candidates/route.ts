@@ -0,0 +1,67 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { rateLimitByIP } from '@/lib/rate-limit';
+import { CollegeDataService } from '@/lib/database';
+import { cached } from '@/lib/api-cache';
+import { getBoundingBox } from '@/lib/geo-utils';
+import { getCandidateMaxSatBand } from '@/lib/recommendations';
+
+/**
+ * Recommendation candidates near a location for a user's SAT/ACT score.
+ * Reads the precomputed recommendation_candidates index so a request only
+ * touches institutions within the search radius and the user's SAT range.
+ * Falls back to the general institution listing if the index hasn't been
+ * built on this database yet.
+ */
+export async function GET(request: NextRequest) {
+  const limited = rateLimitByIP(request, 'inst-candidates', { limit: 30, windowSeconds: 60 });
+  if (limited) return limited;
+
+  try {
+    const { searchParams } = new URL(request.url);
+    const sat = parseFloat(searchParams.get('sat') || '') || undefined;
+    const act = parseFloat(searchParams.get('act') || '') || undefined;
+    const latitude = parseFloat(searchParams.get('latitude') || '');
+    const longitude = parseFloat(searchParams.get('longitude') || '');
+    const radiusMiles = parseInt(searchParams.get('radiusMiles') || '50'); // Default 50 mile radius
+
+    if (Number.isNaN(latitude) || Number.isNaN(longitude)) {
+      return NextResponse.json(
+        { error: 'latitude and longitude are required' },
+        { status: 400 }
+      );
+    }
+
+    const collegeService = new CollegeDataService();
+    const maxSatBand = getCandidateMaxSatBand({ sat, act });
+    const bounds = getBoundingBox(latitude, longitude, radiusMiles);
+
+    let institutions;
+    let fromIndex = true;
+    try {
+      institutions = await cached(`inst-candidates:${request.url}`, 2592000, async () => {
+        return collegeService.getRecommendationCandidates({ bounds, maxSatBand });
+      });
+    } catch (error) {
+      // Table missing until scripts/migrations/add_recommendation_candidates.sql is applied
+      if (!String(error).includes('no such table')) throw error;
+      console.warn('recommendation_candidates missing, falling back to institution listing');
+      fromIndex = false;
+      // Short TTL so the index is picked up soon after the migration runs
+      institutions = await cached('institutions:recommendations-fallback', 3600, async () => {
+        return collegeService.getInstitutions(1000, 0);
+      });
+    }
+
+    const response = NextResponse.json({ institutions });
+    if (fromIndex) {
+      response.headers.set('Cache-Control', 'public, s-maxage=2592000, stale-while-revalidate=604800');
+    }
+    return response;
+  } catch (error) {
+    console.error('Error fetching recommendation candidates:', error);
+    return NextResponse.json(
+      { error: 'Failed to fetch recommendation candidates' },
+      { status: 500 }
+    );
+  }
+}
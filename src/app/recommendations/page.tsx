@@ -57,6 +57,24 @@ export default function RecommendationsPage() {
     }
   }, [maxDistance, userStats?.latitude, userStats?.longitude]);
 
+  // Reads the precomputed candidate index for the user's SAT range within the radius
+  const fetchCandidateInstitutions = async (stats: UserStats, distance: number): Promise<Institution[]> => {
+    const params = new URLSearchParams({
+      latitude: String(stats.latitude),
+      longitude: String(stats.longitude),
+      radiusMiles: String(distance)
+    });
+    if (stats.sat) params.set('sat', String(stats.sat));
+    if (stats.act) params.set('act', String(stats.act));
+
+    const response = await fetch(`/api/institutions/candidates?${params}`);
+    const data = await response.json();
+    if (!response.ok) {
+      throw new Error(data.error || 'Failed to fetch recommendation candidates');
+    }
+    return data.institutions || [];
+  };
+
   const loadUserStatsAndRecommendations = async () => {
     try {
       setLoading(true);
@@ -136,10 +154,10 @@ export default function RecommendationsPage() {
 
       setUserStats(stats);
 
-      // Fetch institutions (get top 1000 to ensure we have enough nearby)
-      const response = await fetch('/api/institutions?limit=1000');
-      const data = await response.json();
-      const institutions: Institution[] = data.institutions || [];
+      // Fetch recommendation candidates near the user for their SAT band
+      const institutions = stats.latitude && stats.longitude
+        ? await fetchCandidateInstitutions(stats, maxDistance)
+        : [];
 
       // Generate recommendations
       const recs = generateRecommendations(institutions, stats, maxDistance);
@@ -158,9 +176,7 @@ export default function RecommendationsPage() {
     }
 
     try {
-      const response = await fetch('/api/institutions?limit=1000');
-      const data = await response.json();
-      const institutions: Institution[] = data.institutions || [];
+      const institutions = await fetchCandidateInstitutions(userStats, maxDistance);
       const recs = generateRecommendations(institutions, userStats, maxDistance);
       const grouped = groupRecommendationsByCategory(recs);
       setRecommendations(grouped);
@@ -197,9 +213,7 @@ export default function RecommendationsPage() {
       setZipCodeInput(''); // Clear input after successful change
 
       // Regenerate recommendations with new location
-      const response = await fetch('/api/institutions?limit=1000');
-      const data = await response.json();
-      const institutions: Institution[] = data.institutions || [];
+      const institutions = await fetchCandidateInstitutions(newStats, maxDistance);
       const recs = generateRecommendations(institutions, newStats, maxDistance);
       const grouped = groupRecommendationsByCategory(recs);
       setRecommendations(grouped);
@@ -489,9 +503,7 @@ export default function RecommendationsPage() {
                               setUserStats(newStats);
                               
                               // Immediately regenerate recommendations with new location
-                              const response = await fetch('/api/institutions?limit=1000');
-                              const data = await response.json();
-                              const institutions: Institution[] = data.institutions || [];
+                              const institutions = await fetchCandidateInstitutions(newStats, maxDistance);
                               const recs = generateRecommendations(institutions, newStats, maxDistance);
                               const grouped = groupRecommendationsByCategory(recs);
                               setRecommendations(grouped);
@@ -520,9 +532,7 @@ export default function RecommendationsPage() {
                               setUserStats(newStats);
                               
                               // Immediately regenerate recommendations with new location
-                              const response = await fetch('/api/institutions?limit=1000');
-                              const data = await response.json();
-                              const institutions: Institution[] = data.institutions || [];
+                              const institutions = await fetchCandidateInstitutions(newStats, maxDistance);
                               const recs = generateRecommendations(institutions, newStats, maxDistance);
                               const grouped = groupRecommendationsByCategory(recs);
                               setRecommendations(grouped);
@@ -697,6 +697,84 @@ export class CollegeDataService {
     }));
   }
 
+  // Get recommendation candidates near a location from the precomputed
+  // recommendation_candidates index (scripts/migrations/add_recommendation_candidates.sql)
+  // instead of scanning every institution. Reads every SAT band up to maxSatBand
+  // (all bands when omitted), including unscored institutions in band -1.
+  // Institutions indexed in several bands are collapsed to one row. Results are
+  // ordered by acceptance rate and not limited. The bounding box bounds the scan.
+  async getRecommendationCandidates(filters: {
+    bounds: { minLat: number; maxLat: number; minLon: number; maxLon: number };
+    maxSatBand?: number;
+  }): Promise<Institution[]> {
+    const { clause: statesClause, params: stateParams } = getStatesInClause();
+    const { minLat, maxLat, minLon, maxLon } = filters.bounds;
+
+    let candidateWhere = `c.latitude BETWEEN ? AND ? AND c.longitude BETWEEN ? AND ?`;
+    const params: any[] = [minLat, maxLat, minLon, maxLon];
+
+    if (filters.maxSatBand !== undefined) {
+      candidateWhere += ` AND c.sat_band <= ?`;
+      params.push(filters.maxSatBand);
+    }
+
+    const query = `
+      WITH candidates AS (
+        SELECT c.unitid, c.acceptance_rate, c.average_sat, c.average_act,
+               ROW_NUMBER() OVER (PARTITION BY c.unitid ORDER BY c.sat_band) AS rn
+        FROM recommendation_candidates c
+        WHERE ${candidateWhere}
+      ),
+      latest_financial AS (
+        SELECT f.unitid, f.tuition_in_state, f.tuition_out_state, f.fees,
+               f.room_board_on_campus, f.net_price,
+               ROW_NUMBER() OVER (PARTITION BY f.unitid ORDER BY f.year DESC) AS rn
+        FROM financial_data f
+        JOIN institutions ins ON f.unitid = ins.unitid
+        WHERE f.unitid IN (SELECT unitid FROM candidates)
+          AND NOT (ins.control_public_private = 1 AND f.tuition_in_state = f.tuition_out_state)
+      )
+      SELECT
+        i.id, i.unitid, i.name, i.city, i.state, i.zip_code,
+        i.latitude, i.longitude, i.website, i.control_public_private,
+        c.acceptance_rate, c.average_sat, c.average_act,
+        f.tuition_in_state, f.tuition_out_state, f.fees, f.room_board_on_campus, f.net_price
+      FROM candidates c
+      JOIN institutions i ON i.unitid = c.unitid
+      LEFT JOIN latest_financial f ON f.unitid = c.unitid AND f.rn = 1
+      WHERE c.rn = 1 AND ${statesClause}
+      ORDER BY c.acceptance_rate IS NULL, c.acceptance_rate, c.unitid
+    `;
+    params.push(...stateParams);
+
+    const results = await this.ensureDb().prepare(query).all(...params) as any[];
+
+    return results.map(row => ({
+      id: row.id || row.unitid,
+      unitid: row.unitid,
+      name: row.name,
+      institution_name: row.name,
+      city: row.city,
+      state: row.state,
+      state_postal_code: row.state,
+      zipcode: row.zip_code,
+      latitude: row.latitude,
+      longitude: row.longitude,
+      website: row.website && !row.website.startsWith('http') ? `https://${row.website}` : row.website,
+      website_url: row.website && !row.website.startsWith('http') ? `https://${row.website}` : row.website,
+      control_of_institution: row.control_public_private,
+      control_public_private: row.control_public_private,
+      tuition_in_state: row.tuition_in_state,
+      tuition_out_state: row.tuition_out_state,
+      fees: row.fees,
+      room_board_on_campus: row.room_board_on_campus,
+      net_price: row.net_price,
+      acceptance_rate: row.acceptance_rate,
+      average_sat: row.average_sat,
+      average_act: row.average_act
+    }));
+  }
+
   // Get summary statistics
   async getDatabaseStats() {
     const { clause: statesClause, params: stateParams } = getStatesInClause();
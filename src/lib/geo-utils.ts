@@ -212,6 +212,29 @@ export function filterByProximity<T extends { latitude?: number; longitude?: num
     .sort((a, b) => a.distance_miles - b.distance_miles); // Sort by closest first
 }
 
+/**
+ * Latitude/longitude box enclosing a radius around a point, for prefiltering in SQL
+ * @param centerLat Center latitude
+ * @param centerLon Center longitude
+ * @param radiusMiles Radius in miles
+ * @returns Min/max latitude and longitude of the enclosing box
+ */
+export function getBoundingBox(
+  centerLat: number,
+  centerLon: number,
+  radiusMiles: number
+): { minLat: number; maxLat: number; minLon: number; maxLon: number } {
+  const latDelta = radiusMiles / 69; // ~69 miles per degree of latitude
+  const lonDelta = radiusMiles / (69 * Math.max(Math.cos(toRadians(centerLat)), 0.01));
+
+  return {
+    minLat: centerLat - latDelta,
+    maxLat: centerLat + latDelta,
+    minLon: centerLon - lonDelta,
+    maxLon: centerLon + lonDelta,
+  };
+}
+
 /**
  * Validate and normalize US zip code
  * @param zipCode Input zip code string
@@ -87,6 +87,35 @@ export function convertSatToAct(sat: number): number {
   return 10;
 }
 
+/**
+ * Width of the normalized SAT bands in the recommendation_candidates index.
+ * Must stay in sync with scripts/migrations/add_recommendation_candidates.sql
+ */
+export const SAT_BAND_WIDTH = 100;
+
+/**
+ * Band holding institutions without SAT/ACT ranges (e.g. test-optional schools).
+ * It sorts below every real band, so every candidate read includes it.
+ */
+export const UNSCORED_SAT_BAND = -1;
+
+/**
+ * Returns the highest SAT band to read from the recommendation_candidates index,
+ * or undefined to read every band (users without a test score).
+ *
+ * Institutions are indexed in every band their 25th-75th SAT range overlaps, and
+ * reads take all bands up to this one. That returns every nearby institution with
+ * a 25th percentile below the top of the band above the user's, plus all
+ * unscored institutions, so safeties are never dropped. Only institutions whose
+ * whole range starts more than one band above the user are skipped.
+ */
+export function getCandidateMaxSatBand(userStats: UserStats): number | undefined {
+  const userSat = userStats.sat || (userStats.act ? convertActToSat(userStats.act) : undefined);
+  if (!userSat) return undefined;
+
+  return Math.floor(userSat / SAT_BAND_WIDTH) * SAT_BAND_WIDTH + SAT_BAND_WIDTH;
+}
+
 /**
  * Calculates recommendation category based on user stats vs institution data
  * Returns 'safety', 'match', or 'reach' with a confidence score
@@ -0,0 +1,65 @@
+/**
+ * Recommendation Candidate Band Unit Tests
+ * ==========================================
+ * Tests for:
+ * - getCandidateMaxSatBand: highest SAT band read from the recommendation_candidates
+ *   index (every band up to one above the user's, SAT_BAND_WIDTH wide, ACT
+ *   converted via convertActToSat, undefined = read all bands)
+ * - UNSCORED_SAT_BAND: sentinel band for institutions without SAT/ACT ranges
+ *
+ * Band keys must match scripts/migrations/add_recommendation_candidates.sql.
+ *
+ * No database required — all logic is pure.
+ *
+ * Run: npx vitest run src/tests/recommendations.test.ts
+ */
+
+import { describe, it, expect } from 'vitest';
+import {
+  SAT_BAND_WIDTH,
+  UNSCORED_SAT_BAND,
+  convertActToSat,
+  getCandidateMaxSatBand,
+} from '@/lib/recommendations';
+
+describe('getCandidateMaxSatBand', () => {
+  it('uses 100-point bands to match the candidate index migration', () => {
+    expect(SAT_BAND_WIDTH).toBe(100);
+  });
+
+  it('reads up to one band above the SAT band', () => {
+    expect(getCandidateMaxSatBand({ sat: 1250 })).toBe(1300);
+  });
+
+  it('converts ACT-only users through the concordance table', () => {
+    expect(convertActToSat(28)).toBe(1310);
+    expect(getCandidateMaxSatBand({ act: 28 })).toBe(1400);
+  });
+
+  it('prefers SAT when both scores are given', () => {
+    expect(getCandidateMaxSatBand({ sat: 1050, act: 34 })).toBe(1100);
+  });
+
+  it('reads every band without a test score', () => {
+    expect(getCandidateMaxSatBand({})).toBeUndefined();
+    expect(getCandidateMaxSatBand({ gpa: 3.8, latitude: 40.7, longitude: -74 })).toBeUndefined();
+  });
+
+  it('puts band edges in the upper band', () => {
+    expect(getCandidateMaxSatBand({ sat: 1199 })).toBe(1200);
+    expect(getCandidateMaxSatBand({ sat: 1200 })).toBe(1300);
+  });
+
+  it('always includes unscored institutions and low-range safeties', () => {
+    const maxBand = getCandidateMaxSatBand({ sat: 1500 })!;
+
+    expect(UNSCORED_SAT_BAND).toBeLessThan(0);
+    expect(UNSCORED_SAT_BAND).toBeLessThanOrEqual(maxBand);
+    expect(900).toBeLessThanOrEqual(maxBand);
+  });
+
+  it('reaches schools whose range contains the user score but whose midpoint does not', () => {
+    // A 1100-1400 school is indexed in bands 1100-1400, a 1050 user reads up to 1100
+    expect(getCandidateMaxSatBand({ sat: 1050 })).toBeGreaterThanOrEqual(1100);
+  });
+});
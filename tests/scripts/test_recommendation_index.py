@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Recommendation candidate index tests
+Builds recommendation_candidates from a small in-memory admissions dataset.
+
+Run: python -m pytest tests/scripts/test_recommendation_index.py
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "scripts"))
+
+from refresh_database import DatabaseRefresher  # noqa: E402
+
+
+INSTITUTIONS = [
+    # unitid, name, state, region, latitude, longitude
+    (1, 'Selective CA', 'CA', '8', 34.0, -118.0),
+    (2, 'Open CA', 'CA', '8', 37.0, -122.0),
+    (3, 'ACT Only NY', 'NY', '2', 40.7, -74.0),
+    (4, 'No Scores TX', 'TX', '6', 30.0, -97.0),
+    (5, 'Unknown Rate NV', 'NV', '8', 36.0, -115.0),
+    (6, 'Wide Range NV', 'NV', '8', 39.5, -119.8),
+    (7, 'No Admissions NV', 'NV', '8', 36.2, -115.1),
+    (8, 'No Coordinates CA', 'CA', '8', None, None),
+]
+
+ADMISSIONS = [
+    # unitid, year, admitted, applicants, math25, math75, verbal25, verbal75, act25, act75
+    (1, 2023, 5, 100, 650, 700, 650, 700, None, None),
+    (1, 2022, 90, 100, 300, 350, 300, 350, None, None),  # superseded by 2023
+    (2, 2023, 80, 100, 640, 690, 640, 690, None, None),
+    (3, 2023, None, None, None, None, None, None, 28.5, 40),
+    (4, 2023, 50, 100, None, None, None, None, None, None),
+    (5, 2023, None, 0, 650, 700, 650, 700, None, None),
+    (6, 2023, 40, 100, 550, 700, 550, 700, None, None),
+    (8, 2023, 50, 100, 600, 700, 600, 700, None, None),
+]
+
+
+@pytest.fixture
+def refresher(tmp_path):
+    refresher = DatabaseRefresher(db_path=tmp_path / "college_data.db")
+    refresher.conn = sqlite3.connect(":memory:")
+    refresher.create_fresh_schema()
+    refresher.conn.executemany(
+        "INSERT INTO institutions (unitid, name, state, region, latitude, longitude) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        INSTITUTIONS,
+    )
+    refresher.conn.executemany(
+        "INSERT INTO admissions_data (unitid, year, admissions_total, applicants_total, "
+        "sat_math_25th, sat_math_75th, sat_verbal_25th, sat_verbal_75th, "
+        "act_composite_25th, act_composite_75th) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        ADMISSIONS,
+    )
+    refresher.build_recommendation_index()
+    yield refresher
+    refresher.conn.close()
+
+
+def read_candidates(conn, where, order_by):
+    return conn.execute(
+        f"SELECT unitid FROM recommendation_candidates WHERE {where} ORDER BY {order_by}"
+    ).fetchall()
+
+
+def test_uses_latest_admissions_year(refresher):
+    bands = refresher.conn.execute(
+        "SELECT sat_band, sat_25th, sat_75th FROM recommendation_candidates WHERE unitid = 1"
+    ).fetchall()
+
+    assert bands == [(1300, 1300.0, 1400.0), (1400, 1300.0, 1400.0)]
+
+
+def test_act_fallback_matches_typescript_conversion(refresher):
+    act_only = refresher.conn.execute(
+        "SELECT sat_25th, sat_75th, average_sat, average_act "
+        "FROM recommendation_candidates WHERE unitid = 3 LIMIT 1"
+    ).fetchone()
+
+    # ACT 28.5 rounds half-up to 29 (1340), 40 is outside the table (act * 40)
+    assert act_only == (1340.0, 1600.0, None, 34)
+
+
+def test_average_sat_matches_calculate_roi(refresher):
+    average_sat = refresher.conn.execute(
+        "SELECT average_sat FROM recommendation_candidates WHERE unitid = 1 LIMIT 1"
+    ).fetchone()[0]
+
+    assert average_sat == 1350
+
+
+def test_unscored_institutions_use_sentinel_band(refresher):
+    unscored = refresher.conn.execute(
+        "SELECT unitid, acceptance_rate FROM recommendation_candidates "
+        "WHERE sat_band = -1 ORDER BY rank, unitid"
+    ).fetchall()
+
+    assert unscored == [(4, 0.5), (7, None)]
+
+
+def test_institutions_without_coordinates_are_skipped(refresher):
+    count = refresher.conn.execute(
+        "SELECT COUNT(*) FROM recommendation_candidates WHERE unitid = 8"
+    ).fetchone()[0]
+
+    assert count == 0
+
+
+def test_institution_is_indexed_in_every_overlapped_band(refresher):
+    bands = [
+        row[0] for row in refresher.conn.execute(
+            "SELECT sat_band FROM recommendation_candidates WHERE unitid = 6 ORDER BY sat_band"
+        )
+    ]
+
+    assert bands == [1100, 1200, 1300, 1400]
+
+
+def test_state_rank_orders_by_acceptance_rate(refresher):
+    ranked = read_candidates(refresher.conn, "sat_band = 1300 AND state = 'CA'", "rank")
+
+    assert ranked == [(1,), (2,)]
+
+
+def test_null_acceptance_rate_sorts_last(refresher):
+    ranked = read_candidates(refresher.conn, "sat_band = 1300 AND state = 'NV'", "rank")
+
+    # unitid 5 has zero applicants, so no acceptance rate
+    assert ranked == [(6,), (5,)]
+
+
+def test_rebuild_is_idempotent(refresher):
+    before = refresher.conn.execute("SELECT COUNT(*) FROM recommendation_candidates").fetchone()
+    refresher.build_recommendation_index()
+    after = refresher.conn.execute("SELECT COUNT(*) FROM recommendation_candidates").fetchone()
+
+    assert before == after